@@ -104,8 +104,9 @@ class FunctionLoader:
             ModuleLoadError: If the module fails to load
         """
         # Resolve the file path first to get the actual file location
+        # (_find_file only returns paths that are existing files)
         file_path_obj = self.file_loader._find_file(file_path)
-        if not file_path_obj or not file_path_obj.is_file():
+        if file_path_obj is None:
             raise HandlerFileNotFoundError(file_path, self.file_loader.search_paths)
 
         # Use the resolved absolute path for caching to avoid duplicate loads
@@ -1,8 +1,10 @@
 """FastAPI-specific configuration and utilities."""
 
+from .config import FASTAPI_ENV_CONFIG, EnvSpec, FastAPIEnvVars
 from .middleware import (
     MiddlewareInfo,
     MiddlewareRegistry,
+    ProcessASGIMiddleware,
     create_middleware_object,
     custom_middleware,
     input_formatter,
@@ -20,4 +22,8 @@ __all__ = [
     "MiddlewareInfo",
     "MiddlewareRegistry",
     "middleware_registry",
+    "ProcessASGIMiddleware",
+    "EnvSpec",
+    "FastAPIEnvVars",
+    "FASTAPI_ENV_CONFIG",
 ]
@@ -1,5 +1,9 @@
 """FastAPI-specific configuration constants."""
 
+from types import MappingProxyType
+
+from ...config import EnvSpec
+
 
 class FastAPIEnvVars:
     """FastAPI environment variable names."""
@@ -18,31 +22,33 @@ class FastAPIEnvVars:
 
 
 # FastAPI environment variable configuration mapping
-FASTAPI_ENV_CONFIG = {
-    # Handler configuration
-    FastAPIEnvVars.CUSTOM_FASTAPI_PING_HANDLER: {
-        "default": None,
-        "description": "Custom ping handler specification (function spec or router URL)",
-    },
-    FastAPIEnvVars.CUSTOM_FASTAPI_INVOCATION_HANDLER: {
-        "default": None,
-        "description": "Custom invocation handler specification (function spec or router URL)",
-    },
-    # Middleware configuration
-    FastAPIEnvVars.CUSTOM_PRE_PROCESS: {
-        "default": None,
-        "description": "Custom pre-process middleware specification (filename.py:function | module.name:function | module.name:Class.method)",
-    },
-    FastAPIEnvVars.CUSTOM_POST_PROCESS: {
-        "default": None,
-        "description": "Custom post-process middleware specification (filename.py:function | module.name:function | module.name:Class.method)",
-    },
-    FastAPIEnvVars.CUSTOM_FASTAPI_MIDDLEWARE_THROTTLE: {
-        "default": None,
-        "description": "Custom throttle middleware specification (filename.py:function | module.name:function | module.name:Class.method)",
-    },
-    FastAPIEnvVars.CUSTOM_FASTAPI_MIDDLEWARE_PRE_POST_PROCESS: {
-        "default": None,
-        "description": "Custom pre/post process middleware specification (filename.py:function | module.name:function | module.name:Class.method)",
-    },
-}
+FASTAPI_ENV_CONFIG = MappingProxyType(
+    {
+        # Handler configuration
+        FastAPIEnvVars.CUSTOM_FASTAPI_PING_HANDLER: EnvSpec(
+            default=None,
+            description="Custom ping handler specification (function spec or router URL)",
+        ),
+        FastAPIEnvVars.CUSTOM_FASTAPI_INVOCATION_HANDLER: EnvSpec(
+            default=None,
+            description="Custom invocation handler specification (function spec or router URL)",
+        ),
+        # Middleware configuration
+        FastAPIEnvVars.CUSTOM_PRE_PROCESS: EnvSpec(
+            default=None,
+            description="Custom pre-process middleware specification (filename.py:function | module.name:function | module.name:Class.method)",
+        ),
+        FastAPIEnvVars.CUSTOM_POST_PROCESS: EnvSpec(
+            default=None,
+            description="Custom post-process middleware specification (filename.py:function | module.name:function | module.name:Class.method)",
+        ),
+        FastAPIEnvVars.CUSTOM_FASTAPI_MIDDLEWARE_THROTTLE: EnvSpec(
+            default=None,
+            description="Custom throttle middleware specification (filename.py:function | module.name:function | module.name:Class.method)",
+        ),
+        FastAPIEnvVars.CUSTOM_FASTAPI_MIDDLEWARE_PRE_POST_PROCESS: EnvSpec(
+            default=None,
+            description="Custom pre/post process middleware specification (filename.py:function | module.name:function | module.name:Class.method)",
+        ),
+    }
+)
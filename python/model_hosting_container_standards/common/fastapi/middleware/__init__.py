@@ -2,6 +2,7 @@
 
 from .core import create_middleware_object, load_middlewares
 from .decorators import custom_middleware, input_formatter, output_formatter
+from .process import ProcessASGIMiddleware
 from .registry import MiddlewareInfo, MiddlewareRegistry, middleware_registry
 
 __all__ = [
@@ -13,4 +14,5 @@ __all__ = [
     "MiddlewareInfo",
     "MiddlewareRegistry",
     "middleware_registry",
+    "ProcessASGIMiddleware",
 ]
@@ -109,16 +109,13 @@ def _add_middleware(app: "FastAPI", middleware_name: str) -> bool:
     Returns:
         True if middleware was added, False otherwise
     """
-    if middleware_registry.has_middleware(middleware_name):
-        middleware_info = middleware_registry.get_middleware(middleware_name)
+    middleware_info = middleware_registry.get_middleware(middleware_name)
 
-        if middleware_info is None:
-            return False
+    if middleware_info is None:
+        return False
 
-        middleware_obj = create_middleware_object(middleware_info)
+    middleware_obj = create_middleware_object(middleware_info)
 
-        app.user_middleware.append(middleware_obj)
-        logger.info(f"[MIDDLEWARE_LOADER] Added middleware: {middleware_name}")
-        return True
-
-    return False
+    app.user_middleware.append(middleware_obj)
+    logger.info(f"[MIDDLEWARE_LOADER] Added middleware: {middleware_name}")
+    return True
@@ -0,0 +1,310 @@
+"""Pure ASGI middleware that applies input/output formatters.
+
+Unlike ``BaseHTTPMiddleware``, this middleware only runs the response in a
+separate task when the downstream app streams it. The request is handed to the
+input formatter as a Starlette ``Request``. The output formatter receives a
+buffered ``Response`` for single-message responses and a ``StreamingResponse``
+over the live chunks for streamed ones. Both expose ``body_iterator`` as
+``BaseHTTPMiddleware`` responses did, and buffered ones also expose ``body``, which
+may be rewritten. Formatters may be sync or async.
+"""
+
+import inspect
+from typing import AsyncIterator, Callable, List, Optional
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ....logging_config import logger
+
+
+def _replay_body(body: bytes, receive: Receive) -> Receive:
+    """Create a receive callable that replays an already-read request body."""
+    body_sent = False
+
+    async def receive_wrapper() -> Message:
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # Body already delivered - fall through for http.disconnect
+        return await receive()
+
+    return receive_wrapper
+
+
+async def _iterate_body(body: bytes) -> AsyncIterator[bytes]:
+    """Yield a buffered body as a single chunk."""
+    yield body
+
+
+class _BufferedResponse(Response):
+    """Buffered response exposing both ``body`` and ``body_iterator``.
+
+    Formatters written for ``BaseHTTPMiddleware`` read or replace
+    ``body_iterator``; others read or set ``body``. When the iterator is replaced
+    its chunks are streamed, otherwise ``body`` is sent with a ``content-length``
+    matching it.
+    """
+
+    def __init__(self, body: bytes, start_message: Message) -> None:
+        super().__init__(content=body, status_code=start_message["status"])
+        self.raw_headers = list(start_message.get("headers", []))
+        self._original_body = body
+        self._original_iterator = self.body_iterator = _iterate_body(body)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.body_iterator is not self._original_iterator:
+            streaming = StreamingResponse(
+                self.body_iterator,
+                status_code=self.status_code,
+                background=self.background,
+            )
+            streaming.raw_headers = self.raw_headers
+            # Length of the replaced iterator is unknown
+            del streaming.headers["content-length"]
+            await streaming(scope, receive, send)
+            return
+        if self.body is not self._original_body:
+            # Body rewritten by the formatter - keep content-length in sync
+            self.headers["content-length"] = str(len(self.body))
+        await super().__call__(scope, receive, send)
+
+
+class ProcessASGIMiddleware:
+    """ASGI middleware applying pre-process and post-process formatters.
+
+    The input formatter receives a ``Request`` and may return a replacement. If the
+    formatter read or rewrote the body (``request._body``), the body is replayed to
+    the downstream app. The output formatter receives the buffered ``Response``, or
+    a ``StreamingResponse`` over the live chunks when the app streams, and may
+    return a replacement, which is then sent to the client. Sync formatters
+    are called directly rather than awaited. Coroutine functions are detected at
+    construction; for other formatters the result is checked per call, so async
+    callables such as objects with an async ``__call__`` are still awaited.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        input_formatter: Optional[Callable] = None,
+        output_formatter: Optional[Callable] = None,
+        middleware_name: str = "pre_post_process",
+        log_prefix: str = "PROCESS",
+    ) -> None:
+        self.app = app
+        self._input_formatter = input_formatter
+        self._output_formatter = output_formatter
+        self._input_is_async = inspect.iscoroutinefunction(input_formatter)
+        self._output_is_async = inspect.iscoroutinefunction(output_formatter)
+        self._middleware_name = middleware_name
+        self._log_prefix = log_prefix
+        # Without formatters every request passes straight through
+        self._noop = input_formatter is None and output_formatter is None
+
+    async def _format_response(
+        self, output_fmt: Callable, response: Response
+    ) -> Response:
+        """Apply the output formatter, keeping the response if it returns None."""
+        result = output_fmt(response)
+        if self._output_is_async or inspect.isawaitable(result):
+            result = await result
+        return result or response
+
+    async def _start_passthrough(self, start_message: Message, send: Send) -> None:
+        """Forward a response the output formatter cannot see, starting with its start message."""
+        logger.debug(
+            "[%s] Response uses an ASGI extension, skipping post-process function",
+            self._log_prefix,
+        )
+        await send(start_message)
+
+    async def _send_trailing(self, messages: List[Message], send: Send) -> None:
+        """Forward extension messages the app sent after the response body."""
+        for message in messages:
+            await send(message)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self._noop or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Bind formatters to locals once per request instead of repeated attribute loads
+        input_fmt = self._input_formatter
+        output_fmt = self._output_formatter
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            # Apply pre-process if exists
+            if input_fmt is not None:
+                logger.debug("[%s] Applying pre-process function", self._log_prefix)
+                request = Request(scope, receive)
+                result = input_fmt(request)
+                # Fall back to an awaitable check for async callables that are not
+                # coroutine functions (e.g. objects with an async __call__)
+                if self._input_is_async or inspect.isawaitable(result):
+                    result = await result
+                request = result or request
+                scope = request.scope
+                if hasattr(request, "_body"):
+                    receive = _replay_body(request._body, receive)
+
+            # Call the next middleware/handler
+            if output_fmt is None:
+                await self.app(scope, receive, send_wrapper)
+                return
+
+            # Single-message responses are buffered so the post-process function
+            # sees a full Response (with body_iterator too). Streamed responses (first body chunk has
+            # more_body=True) are handed over as a StreamingResponse over the live
+            # chunks, so tokens still reach the client as they are produced.
+            start_message: Optional[Message] = None
+            body: Optional[bytes] = None
+            stream: Optional[MemoryObjectSendStream[bytes]] = None
+            error: Optional[Exception] = None
+            body_complete = False
+            # Set for responses carried by ASGI extensions (trailers, pathsend,
+            # zerocopysend); those are forwarded unformatted
+            passthrough = False
+            # Extension messages arriving after the body, sent after the response
+            trailing: List[Message] = []
+
+            async with anyio.create_task_group() as task_group:
+
+                async def send_streaming(
+                    response: Response, chunks: MemoryObjectReceiveStream[bytes]
+                ) -> None:
+                    nonlocal error
+                    try:
+                        # Closing the receive side unblocks the app if the
+                        # formatter replaced the response and never reads it
+                        async with chunks:
+                            # Format here rather than in the app's send call, so a
+                            # formatter draining body_iterator gets chunks as the
+                            # app produces them
+                            logger.debug(
+                                "[%s] Applying post-process function to streamed response",
+                                self._log_prefix,
+                            )
+                            response = await self._format_response(output_fmt, response)
+                            await response(scope, receive, send_wrapper)
+                    except Exception as e:
+                        error = e
+                        task_group.cancel_scope.cancel()
+                        return
+                    if not body_complete:
+                        # Client went away or the body was dropped - stop the app
+                        # instead of letting it generate into the void
+                        task_group.cancel_scope.cancel()
+
+                async def buffer_send(message: Message) -> None:
+                    nonlocal start_message, body, stream, body_complete, passthrough
+                    message_type = message["type"]
+                    if passthrough:
+                        await send_wrapper(message)
+                        return
+                    if message_type == "http.response.start":
+                        start_message = message
+                        if message.get("trailers", False):
+                            await self._start_passthrough(message, send_wrapper)
+                            passthrough = True
+                        return
+                    if message_type != "http.response.body":
+                        if stream is None and body is None:
+                            # The body is not carried by http.response.body messages
+                            if start_message is not None:
+                                await self._start_passthrough(
+                                    start_message, send_wrapper
+                                )
+                            passthrough = True
+                            await send_wrapper(message)
+                        else:
+                            trailing.append(message)
+                        return
+                    chunk = message.get("body", b"")
+                    more_body = message.get("more_body", False)
+                    if stream is None:
+                        if body is not None:
+                            # Buffered response already complete
+                            return
+                        if not more_body:
+                            body = chunk
+                            return
+                        if start_message is None:
+                            raise RuntimeError("Response body sent before start.")
+                        stream, chunks = anyio.create_memory_object_stream()
+                        streaming = StreamingResponse(
+                            chunks, status_code=start_message["status"]
+                        )
+                        streaming.raw_headers = list(start_message.get("headers", []))
+                        task_group.start_soon(send_streaming, streaming, chunks)
+                    try:
+                        await stream.send(chunk)
+                    except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                        # Formatted response no longer consumes the original body
+                        pass
+                    if not more_body:
+                        body_complete = True
+                        await stream.aclose()
+
+                try:
+                    await self.app(scope, receive, buffer_send)
+                except Exception as e:
+                    # Captured rather than raised so the task group does not wrap it
+                    # in an ExceptionGroup
+                    error = e
+                    task_group.cancel_scope.cancel()
+                else:
+                    if stream is not None:
+                        await stream.aclose()
+
+            if error is not None:
+                raise error
+            if passthrough:
+                return
+            if stream is not None:
+                await self._send_trailing(trailing, send_wrapper)
+                return
+
+            if start_message is None:
+                raise RuntimeError("No response returned.")
+
+            response: Response = _BufferedResponse(
+                body if body is not None else b"", start_message
+            )
+
+            # Apply post-process
+            logger.debug("[%s] Applying post-process function", self._log_prefix)
+            response = await self._format_response(output_fmt, response)
+
+            await response(scope, receive, send_wrapper)
+            await self._send_trailing(trailing, send_wrapper)
+
+        except Exception as e:
+            if response_started:
+                # Headers already sent - nothing sensible left to return
+                raise
+            logger.error(
+                "[%s] Error in %s middleware: %s",
+                self._log_prefix,
+                self._middleware_name,
+                e,
+            )
+            # Return 500 error
+            error_response = JSONResponse(
+                status_code=500,
+                content={
+                    "error": f"Internal server error in {self._middleware_name} middleware",
+                    "message": str(e),
+                },
+            )
+            await error_response(scope, receive, send)
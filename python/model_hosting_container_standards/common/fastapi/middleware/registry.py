@@ -1,20 +1,52 @@
 """Middleware registry for storing registered middlewares."""
 
-from typing import Callable, Dict, List, Optional, Union
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    KeysView,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from ....logging_config import logger
 
 # Allowed middleware names in execution order
 ALLOWED_MIDDLEWARE_NAMES = ["throttle", "pre_post_process"]
 
+# Precomputed once per process for validation and error messages
+ALLOWED_MIDDLEWARE_NAME_SET: FrozenSet[str] = frozenset(ALLOWED_MIDDLEWARE_NAMES)
+ALLOWED_MIDDLEWARE_NAMES_STR = ", ".join(sorted(ALLOWED_MIDDLEWARE_NAMES))
+_ORDER: Tuple[str, ...] = tuple(ALLOWED_MIDDLEWARE_NAMES)
+
+
+def _is_class(middleware: Union[Callable, type]) -> bool:
+    """Check whether a middleware is a class.
+
+    The identity check covers plain classes without an MRO walk; isinstance
+    handles classes built with a custom metaclass.
+    """
+    return type(middleware) is type or isinstance(middleware, type)
+
 
 class MiddlewareInfo:
     """Information about registered middleware."""
 
-    def __init__(self, name: str, middleware: Union[Callable, type]):
+    __slots__ = ("name", "middleware", "is_class")
+
+    def __init__(
+        self,
+        name: str,
+        middleware: Union[Callable, type],
+        *,
+        is_class: Optional[bool] = None,
+    ):
         self.name = name
         self.middleware = middleware
-        self.is_class = isinstance(middleware, type)
+        # Callers that already know the middleware kind can skip the check
+        self.is_class = _is_class(middleware) if is_class is None else is_class
 
 
 class MiddlewareRegistry:
@@ -23,8 +55,10 @@ class MiddlewareRegistry:
     def __init__(self) -> None:
         # Simple structure: name -> MiddlewareInfo
         self._middlewares: Dict[str, MiddlewareInfo] = {}
+        # Source ("env" or "decorator") of middlewares registered by load_middlewares
+        self._loaded_sources: Dict[str, str] = {}
         # Only allow these specific middleware names
-        self._allowed_middleware_names = set(ALLOWED_MIDDLEWARE_NAMES)
+        self._allowed_middleware_names = ALLOWED_MIDDLEWARE_NAME_SET
 
     def register_middleware(
         self,
@@ -43,21 +77,29 @@ class MiddlewareRegistry:
         """
         # Check if name is allowed
         if name not in self._allowed_middleware_names:
-            allowed_names = ", ".join(sorted(self._allowed_middleware_names))
             raise ValueError(
-                f"Middleware name '{name}' is not allowed. Allowed names: {allowed_names}"
+                f"Middleware name '{name}' is not allowed. Allowed names: {ALLOWED_MIDDLEWARE_NAMES_STR}"
             )
 
+        new_is_class = _is_class(middleware)
+
         # Check if already registered
-        if name in self._middlewares:
-            existing_type = "class" if self._middlewares[name].is_class else "function"
-            new_type = "class" if isinstance(middleware, type) else "function"
+        existing = self._middlewares.get(name)
+        if existing is not None:
+            existing_type = "class" if existing.is_class else "function"
+            new_type = "class" if new_is_class else "function"
             raise ValueError(
                 f"Middleware '{name}' is already registered as a {existing_type}. Cannot register as {new_type}."
             )
 
         # Register the middleware
-        self._middlewares[name] = MiddlewareInfo(name, middleware)
+        self._store_middleware(name, middleware, new_is_class)
+
+    def _store_middleware(
+        self, name: str, middleware: Union[Callable, type], is_class: bool
+    ) -> None:
+        """Store a middleware entry with its already-computed kind."""
+        self._middlewares[name] = MiddlewareInfo(name, middleware, is_class=is_class)
 
     def get_middleware(self, name: str) -> Optional[MiddlewareInfo]:
         """Get middleware info by name."""
@@ -71,13 +113,27 @@ class MiddlewareRegistry:
         """List all registered middleware names."""
         return list(self._middlewares.keys())
 
+    def list_middlewares_view(self) -> KeysView[str]:
+        """Get a live view of registered middleware names without copying.
+
+        The view reflects later registrations and clears; use list_middlewares()
+        for a snapshot.
+        """
+        return self._middlewares.keys()
+
     def get_allowed_middleware_names(self) -> List[str]:
         """Get list of allowed middleware names."""
         return list(self._allowed_middleware_names)
 
+    @property
+    def allowed_middleware_names(self) -> FrozenSet[str]:
+        """Allowed middleware names as a shared immutable set, without copying."""
+        return self._allowed_middleware_names
+
     def clear_middlewares(self) -> None:
         """Clear all registered middlewares."""
         self._middlewares.clear()
+        self._loaded_sources.clear()
 
     def load_middlewares(self, function_loader) -> None:
         """Load and resolve middlewares from all sources (env vars, decorators, formatters).
@@ -98,13 +154,11 @@ class MiddlewareRegistry:
         logger.debug("[REGISTRY] Loading middlewares from decorators")
         decorator_loader.load()
 
-        # Register with priority (env overrides decorator)
-        self._register_middleware_with_priority(
-            "throttle", env_loader, decorator_loader
-        )
-        self._register_middleware_with_priority(
-            "pre_post_process", env_loader, decorator_loader
-        )
+        # Register with priority (env overrides decorator), in execution order
+        for middleware_name in _ORDER:
+            self._register_middleware_with_priority(
+                middleware_name, env_loader, decorator_loader
+            )
 
         logger.info("[REGISTRY] Middleware resolution and registration complete")
 
@@ -114,9 +168,11 @@ class MiddlewareRegistry:
         """Register middleware with env > decorator priority."""
 
         # Get middleware with priority: env > decorator
-        middleware = env_loader.get_middleware(
-            middleware_name
-        ) or dec_loader.get_middleware(middleware_name)
+        middleware = env_loader.get_middleware(middleware_name)
+        source = "env"
+        if middleware is None:
+            middleware = dec_loader.get_middleware(middleware_name)
+            source = "decorator"
 
         if middleware is None:
             logger.debug(
@@ -124,12 +180,29 @@ class MiddlewareRegistry:
             )
             return
 
+        existing = self._middlewares.get(middleware_name)
+        if existing is not None:
+            # Already registered by a previous load - nothing to do
+            if existing.middleware is middleware:
+                logger.debug(
+                    f"[REGISTRY] {middleware_name} middleware already registered, skipping"
+                )
+                return
+            # The same source rebuilt it (e.g. a formatter was added, or env
+            # middleware recreated on a repeat load) - replace
+            if self._loaded_sources.get(middleware_name) == source:
+                self._store_middleware(
+                    middleware_name, middleware, _is_class(middleware)
+                )
+                logger.debug(
+                    f"[REGISTRY] Replaced {middleware_name} middleware from {source}"
+                )
+                return
+
         # Register in registry
         try:
             self.register_middleware(middleware_name, middleware)
-            source = (
-                "env" if env_loader.get_middleware(middleware_name) else "decorator"
-            )
+            self._loaded_sources[middleware_name] = source
             logger.info(
                 f"[REGISTRY] Registered {middleware_name} middleware from {source}"
             )
@@ -2,7 +2,7 @@
 
 from typing import Any, Callable, Optional
 
-from .....logging_config import logger
+from ..process import ProcessASGIMiddleware
 
 
 class BaseMiddlewareLoader:
@@ -21,57 +21,36 @@ class BaseMiddlewareLoader:
         post_process_func: Optional[Callable],
         middleware_name: str,
         log_prefix: str,
-    ) -> Callable:
+    ) -> type:
         """Create a middleware that applies pre and post processing functions.
 
         Args:
             pre_process_func: Function to call before the main handler
             post_process_func: Function to call after the main handler
-            middleware_name: Name for the middleware function
+            middleware_name: Name for the middleware class
             log_prefix: Prefix for log messages
 
         Returns:
-            Async middleware function
+            Pure ASGI middleware class
         """
 
-        async def middleware(request: Any, call_next: Callable) -> Any:
+        class PrePostProcessMiddleware(ProcessASGIMiddleware):
             """Generic pre/post process middleware."""
-            try:
-                # Apply pre-process if exists
-                if pre_process_func is not None:
-                    logger.debug(f"[{log_prefix}] Applying pre-process function")
-                    request = await pre_process_func(request) or request
 
-                # Call the next middleware/handler
-                response = await call_next(request)
-
-                # Apply post-process if exists
-                if post_process_func is not None:
-                    logger.debug(f"[{log_prefix}] Applying post-process function")
-                    response = await post_process_func(response) or response
-
-                return response
-
-            except Exception as e:
-                logger.error(
-                    f"[{log_prefix}] Error in {middleware_name} middleware: {e}"
-                )
-                # Return 500 error
-                from fastapi.responses import JSONResponse
-
-                return JSONResponse(
-                    status_code=500,
-                    content={
-                        "error": f"Internal server error in {middleware_name} middleware",
-                        "message": str(e),
-                    },
+            def __init__(self, app: Any) -> None:
+                super().__init__(
+                    app,
+                    input_formatter=pre_process_func,
+                    output_formatter=post_process_func,
+                    middleware_name=middleware_name,
+                    log_prefix=log_prefix,
                 )
 
         # Set a meaningful name
-        middleware.__name__ = middleware_name
-        return middleware
+        PrePostProcessMiddleware.__name__ = middleware_name
+        return PrePostProcessMiddleware
 
-    def _combine_pre_post_middleware(self, log_prefix: str) -> Optional[Callable]:
+    def _combine_pre_post_middleware(self, log_prefix: str) -> Optional[type]:
         """Combine pre_fn and post_fn into pre_post_middleware if needed."""
         if self.pre_fn or self.post_fn:
             return self._create_pre_post_middleware(
@@ -3,12 +3,27 @@
 from typing import Callable, Union
 
 from .....logging_config import logger
+from ..registry import ALLOWED_MIDDLEWARE_NAME_SET, ALLOWED_MIDDLEWARE_NAMES_STR
 from .base import BaseMiddlewareLoader
 
 
 class MiddlewareDecoratorLoader(BaseMiddlewareLoader):
     """Loads middleware from decorators and manages formatters."""
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Set when formatters change so load() knows to rebuild the combination
+        self._formatters_dirty = False
+        # Whether pre_post_middleware was built from formatters (vs set directly)
+        self._combined_from_formatters = False
+        # Kept in sync by set_*_formatter/clear so checks are a single attribute load
+        self._has_formatters = False
+
+    @property
+    def has_formatters(self) -> bool:
+        """Whether an input or output formatter is registered."""
+        return self._has_formatters
+
     def load(self) -> None:
         """Process loaded middlewares and handle combinations."""
         # Handle pre_fn + post_fn combination into pre_post_middleware
@@ -22,11 +37,9 @@ class MiddlewareDecoratorLoader(BaseMiddlewareLoader):
             middleware: Middleware function or class
         """
         # Validate allowed middleware names (same as registry)
-        allowed_names = ["throttle", "pre_post_process"]
-        if name not in allowed_names:
-            allowed_names_str = ", ".join(sorted(allowed_names))
+        if name not in ALLOWED_MIDDLEWARE_NAME_SET:
             raise ValueError(
-                f"Middleware name '{name}' is not allowed. Allowed names: {allowed_names_str}"
+                f"Middleware name '{name}' is not allowed. Allowed names: {ALLOWED_MIDDLEWARE_NAMES_STR}"
             )
 
         # Check for duplicate registration
@@ -54,6 +67,8 @@ class MiddlewareDecoratorLoader(BaseMiddlewareLoader):
                 "Input formatter is already registered. Only one input formatter is allowed."
             )
         self.pre_fn = formatter
+        self._formatters_dirty = True
+        self._has_formatters = True
 
     def set_output_formatter(self, formatter: Callable) -> None:
         """Set the output formatter function."""
@@ -62,14 +77,25 @@ class MiddlewareDecoratorLoader(BaseMiddlewareLoader):
                 "Output formatter is already registered. Only one output formatter is allowed."
             )
         self.post_fn = formatter
+        self._formatters_dirty = True
+        self._has_formatters = True
 
     def _handle_pre_post_combination(self) -> None:
         """Handle combination of pre_fn + post_fn into pre_post_middleware if needed."""
+        # Nothing changed since the last combination - keep the existing middleware
+        if not self._formatters_dirty:
+            return
+        self._formatters_dirty = False
+
         # Only combine if we don't already have a direct pre_post_middleware
-        if not self.pre_post_middleware and (self.pre_fn or self.post_fn):
+        if self.pre_post_middleware and not self._combined_from_formatters:
+            return
+
+        if self._has_formatters:
             self.pre_post_middleware = self._combine_pre_post_middleware(
                 "MIDDLEWARE_DEC"
             )
+            self._combined_from_formatters = True
             logger.info(
                 "[MIDDLEWARE_DEC] Created combined pre_post_process middleware from input/output formatters"
             )
@@ -80,6 +106,9 @@ class MiddlewareDecoratorLoader(BaseMiddlewareLoader):
         self.pre_post_middleware = None
         self.pre_fn = None
         self.post_fn = None
+        self._formatters_dirty = False
+        self._combined_from_formatters = False
+        self._has_formatters = False
 
 
 # Global decorator loader instance
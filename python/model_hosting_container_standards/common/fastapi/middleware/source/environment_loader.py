@@ -46,10 +46,11 @@ class MiddlewareEnvironmentLoader(BaseMiddlewareLoader):
             name: Middleware name ("throttle", "pre_post_process", "pre_process", "post_process")
             function_loader: Function loader to use for loading middleware functions
         """
-        if name not in self.middleware_mapping:
+        mapping = self.middleware_mapping.get(name)
+        if mapping is None:
             return
 
-        env_var, property_name = self.middleware_mapping[name]
+        env_var, property_name = mapping
         spec_string = os.getenv(env_var)
 
         if not spec_string:
@@ -1,7 +1,23 @@
 """Configuration constants for model hosting container standards."""
 
+from dataclasses import dataclass
+from typing import Any
+
 # This module can be extended with general configuration that applies
 # to all frameworks. Framework-specific configuration should be imported
 # from their respective submodules:
 # - FastAPI: from .common.fastapi import EnvVars, ENV_CONFIG
 # - SageMaker: from .sagemaker import ... (when needed)
+
+
+@dataclass(frozen=True, slots=True)
+class EnvSpec:
+    """Immutable description of a supported environment variable.
+
+    Attributes:
+        default: Value used when the environment variable is not set
+        description: Human-readable description of the variable
+    """
+
+    default: Any
+    description: str
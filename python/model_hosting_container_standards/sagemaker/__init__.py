@@ -7,7 +7,9 @@ from fastapi import FastAPI
 # Import routing utilities (generic)
 from ..common.fastapi.routing import RouteConfig, safe_include_router
 from ..common.handler.decorators import override_handler, register_handler
+from ..config import EnvSpec
 from ..logging_config import logger
+from .config import SAGEMAKER_ENV_CONFIG, SageMakerEnvVars
 
 # Import the real resolver functions
 from .handler_resolver import register_sagemaker_overrides
@@ -181,4 +183,7 @@ __all__: List[str] = [
     "stateful_session_manager",
     "bootstrap",
     "RouteConfig",
+    "EnvSpec",
+    "SageMakerEnvVars",
+    "SAGEMAKER_ENV_CONFIG",
 ]
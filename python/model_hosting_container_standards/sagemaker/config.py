@@ -1,10 +1,13 @@
 """SageMaker-specific configuration constants."""
 
 import os
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from ..config import EnvSpec
+
 SAGEMAKER_ENV_VAR_PREFIX = "SAGEMAKER_"
 
 
@@ -110,13 +113,15 @@ class SageMakerDefaults:
 
 
 # SageMaker environment variable configuration mapping
-SAGEMAKER_ENV_CONFIG = {
-    SageMakerEnvVars.CUSTOM_SCRIPT_FILENAME: {
-        "default": SageMakerDefaults.SCRIPT_FILENAME,
-        "description": "Custom script filename to load (default: model.py)",
-    },
-    SageMakerEnvVars.SAGEMAKER_MODEL_PATH: {
-        "default": SageMakerDefaults.SCRIPT_PATH,
-        "description": "SageMaker model path directory (default: /opt/ml/model/)",
-    },
-}
+SAGEMAKER_ENV_CONFIG = MappingProxyType(
+    {
+        SageMakerEnvVars.CUSTOM_SCRIPT_FILENAME: EnvSpec(
+            default=SageMakerDefaults.SCRIPT_FILENAME,
+            description="Custom script filename to load (default: model.py)",
+        ),
+        SageMakerEnvVars.SAGEMAKER_MODEL_PATH: EnvSpec(
+            default=SageMakerDefaults.SCRIPT_PATH,
+            description="SageMaker model path directory (default: /opt/ml/model/)",
+        ),
+    }
+)
@@ -62,11 +62,24 @@ class SageMakerHandlerConfig(HandlerConfig):
             logger.debug(f"No mapping found for handler type: {handler_type}")
             return None
 
+        # All handler types share one script, so a miss for one type answers the
+        # others without re-raising
+        if SageMakerFunctionLoader.is_customer_script_missing():
+            logger.debug("No customer script found for the default loader")
+            return None
+
         try:
             return SageMakerFunctionLoader.load_function_from_spec(
                 f"model:{custom_function_name}"
             )
-        except (HandlerFileNotFoundError, HandlerNotFoundError) as e:
+        except HandlerFileNotFoundError as e:
+            # Script file missing - remember it so later lookups skip the raise
+            SageMakerFunctionLoader.mark_customer_script_missing()
+            logger.debug(
+                f"No customer script {custom_function_name} function found: {type(e).__name__}"
+            )
+            return None
+        except HandlerNotFoundError as e:
             # Function not found - continue to next priority
             logger.debug(
                 f"No customer script {custom_function_name} function found: {type(e).__name__}"
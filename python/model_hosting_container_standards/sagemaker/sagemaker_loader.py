@@ -10,12 +10,17 @@ Usage:
 """
 
 import os
-from typing import Any, Callable, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
 
 from ..common.fastapi.config import FastAPIEnvVars
 from ..common.handler.spec import HandlerSpec, parse_handler_spec
+from ..exceptions import HandlerFileNotFoundError
+from ..logging_config import logger
 from .config import SageMakerDefaults, SageMakerEnvVars
 
+if TYPE_CHECKING:
+    from ..common.custom_code_ref_resolver.function_loader import FunctionLoader
+
 
 class SageMakerFunctionLoader:
     """Utility class for SageMaker function loading from environment variables.
@@ -25,10 +30,15 @@ class SageMakerFunctionLoader:
     """
 
     # Class-level cached function loader to avoid recreating instances
-    _default_function_loader: Optional[Any] = None
+    _default_function_loader: Optional["FunctionLoader"] = None
+    # Default loader whose customer script was found missing. Compared by
+    # identity, so resetting or recreating the default loader re-checks the file.
+    _script_missing_loader: Optional["FunctionLoader"] = None
+    # Loaders for custom script paths, keyed by (script_path, script_filename)
+    _custom_function_loaders: Dict[Tuple[str, str], "FunctionLoader"] = {}
 
     @classmethod
-    def get_function_loader(cls):
+    def get_function_loader(cls) -> "FunctionLoader":
         """Get or create the default SageMaker function loader (cached)."""
         if cls._default_function_loader is None:
             script_path = os.getenv(
@@ -38,6 +48,19 @@ class SageMakerFunctionLoader:
 
         return cls._default_function_loader
 
+    @classmethod
+    def is_customer_script_missing(cls) -> bool:
+        """Check whether the current default loader found no customer script."""
+        return (
+            cls._default_function_loader is not None
+            and cls._script_missing_loader is cls._default_function_loader
+        )
+
+    @classmethod
+    def mark_customer_script_missing(cls) -> None:
+        """Remember that the current default loader has no customer script."""
+        cls._script_missing_loader = cls._default_function_loader
+
     @classmethod
     def get_custom_script_filename(cls, default_script: Optional[str] = None) -> str:
         """Get custom script filename from environment or default."""
@@ -45,8 +68,16 @@ class SageMakerFunctionLoader:
         return os.getenv(SageMakerEnvVars.CUSTOM_SCRIPT_FILENAME, default)
 
     @classmethod
-    def _create_function_loader(cls, script_path: str) -> Any:
-        """Create a function loader for the given script path."""
+    def _create_function_loader(
+        cls, script_path: str, eager: bool = True
+    ) -> "FunctionLoader":
+        """Create a function loader for the given script path.
+
+        Args:
+            script_path: Directory containing the customer script
+            eager: Preload the customer script so its decorators register
+                immediately. When False, the script is only loaded on first use.
+        """
         script_filename = os.getenv(
             SageMakerEnvVars.CUSTOM_SCRIPT_FILENAME, SageMakerDefaults.SCRIPT_FILENAME
         )
@@ -59,9 +90,17 @@ class SageMakerFunctionLoader:
         module_aliases = {"model": model_file_path}
         function_loader = FunctionLoader(search_paths, module_aliases)
 
-        # Preload the model file if it exists to trigger any decorators
-        if os.path.isfile(model_file_path):
-            function_loader.load_module_from_file(model_file_path)
+        # Preload the model file if it exists to trigger any decorators.
+        # The loader checks existence itself, so the happy path needs no extra stat.
+        if eager:
+            try:
+                function_loader.load_module_from_file(model_file_path)
+            except HandlerFileNotFoundError:
+                # A file that exists but cannot be resolved by the loader (e.g. a
+                # relative SAGEMAKER_MODEL_PATH) is a misconfiguration - report it
+                if os.path.isfile(model_file_path):
+                    raise
+                logger.debug(f"No customer script found at {model_file_path}")
 
         return function_loader
 
@@ -77,18 +116,43 @@ class SageMakerFunctionLoader:
         if handler_spec.is_router_path or not handler_spec.is_valid_function_spec():
             return None
 
-        # Check if we can use the cached loader (when using default SageMaker paths)
+        # Use cached loader if no custom path specified
+        if custom_script_path is None:
+            return cls.get_function_loader().load_function(spec)
+
+        # Also use the cached loader if the custom path matches the default
         default_script_path = os.getenv(
             SageMakerEnvVars.SAGEMAKER_MODEL_PATH, SageMakerDefaults.SCRIPT_PATH
         )
-
-        # Use cached loader if no custom path specified OR if custom path matches default
-        if custom_script_path is None or custom_script_path == default_script_path:
+        if custom_script_path == default_script_path:
             return cls.get_function_loader().load_function(spec)
 
-        # Create a new loader for the custom path
-        function_loader = cls._create_function_loader(custom_script_path)
-        return function_loader.load_function(spec)
+        return cls._get_custom_function_loader(custom_script_path).load_function(spec)
+
+    @classmethod
+    def _get_custom_function_loader(cls, script_path: str) -> "FunctionLoader":
+        """Get or create a function loader for a custom script path (cached).
+
+        The loader is lazy, so the script is only loaded on demand, and it is
+        reused across calls so repeated lookups skip path resolution and re-import.
+        """
+        cache_key = (script_path, cls.get_custom_script_filename())
+        function_loader = cls._custom_function_loaders.get(cache_key)
+        if function_loader is None:
+            function_loader = cls._create_function_loader(script_path, eager=False)
+            cls._custom_function_loaders[cache_key] = function_loader
+        return function_loader
+
+    @classmethod
+    def reset_function_loaders(cls) -> None:
+        """Drop all cached function loaders.
+
+        The next lookup creates fresh loaders, so customer scripts rewritten on
+        disk are re-imported and a missing script is checked again.
+        """
+        cls._default_function_loader = None
+        cls._script_missing_loader = None
+        cls._custom_function_loaders.clear()
 
     @classmethod
     def _get_handler_from_env(
@@ -135,23 +135,37 @@ class TestBaseMiddlewareLoader:
         async def post_func(response):
             nonlocal post_called
             post_called = True
+            response.headers["X-Post"] = "true"
             return response
 
         # Create middleware
-        middleware = loader._create_pre_post_middleware(
+        middleware_class = loader._create_pre_post_middleware(
             pre_func, post_func, "test_middleware", "TEST"
         )
+        assert middleware_class.__name__ == "test_middleware"
 
-        # Mock call_next
-        async def call_next(request):
-            return "response"
+        # Mock downstream ASGI app
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"response"})
+
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
 
         # Execute middleware
-        result = await middleware("request", call_next)
+        middleware = middleware_class(app)
+        await middleware(_http_scope(), receive, send)
 
         assert pre_called
         assert post_called
-        assert result == "response"
+        assert messages[0]["status"] == 200
+        assert (b"x-post", b"true") in messages[0]["headers"]
+        assert messages[1]["body"] == b"response"
 
     @pytest.mark.asyncio
     async def test_create_pre_post_middleware_exception_handling(self):
@@ -163,17 +177,37 @@ class TestBaseMiddlewareLoader:
             raise ValueError("Test error")
 
         # Create middleware
-        middleware = loader._create_pre_post_middleware(
+        middleware_class = loader._create_pre_post_middleware(
             failing_pre_func, None, "test_middleware", "TEST"
         )
 
-        # Mock call_next
-        async def call_next(request):
-            return "response"
+        # Mock downstream ASGI app
+        async def app(scope, receive, send):
+            raise AssertionError("Downstream app should not be called")
+
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
 
         # Execute middleware - should return error response
-        result = await middleware("request", call_next)
+        middleware = middleware_class(app)
+        await middleware(_http_scope(), receive, send)
 
         # Should return JSONResponse with error
-        assert hasattr(result, "status_code")
-        assert result.status_code == 500
+        assert messages[0]["status"] == 500
+        assert b"Test error" in messages[1]["body"]
+
+
+def _http_scope():
+    """Build a minimal HTTP scope for driving ASGI middleware directly."""
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/",
+        "query_string": b"",
+        "headers": [],
+    }
@@ -148,6 +148,20 @@ class TestMiddlewareDecoratorLoader:
 
         assert "Output formatter is already registered" in str(exc_info.value)
 
+    def test_has_formatters_tracks_set_and_clear(self):
+        """Test has_formatters follows formatter registration and clear."""
+
+        def output_func():
+            pass
+
+        assert not self.loader.has_formatters
+
+        self.loader.set_output_formatter(output_func)
+        assert self.loader.has_formatters
+
+        self.loader.clear()
+        assert not self.loader.has_formatters
+
     def test_load_no_formatters(self):
         """Test load when no formatters are set."""
         self.loader.load()
@@ -173,6 +187,39 @@ class TestMiddlewareDecoratorLoader:
         assert self.loader.pre_post_middleware is not None
         assert callable(self.loader.pre_post_middleware)
 
+    def test_load_reuses_combined_middleware_when_unchanged(self):
+        """Test repeated load does not rebuild the combined middleware."""
+
+        def input_func():
+            pass
+
+        self.loader.set_input_formatter(input_func)
+        self.loader.load()
+        combined = self.loader.pre_post_middleware
+
+        self.loader.load()
+
+        assert self.loader.pre_post_middleware is combined
+
+    def test_load_rebuilds_combined_middleware_after_formatter_change(self):
+        """Test load rebuilds the combination when a formatter is added later."""
+
+        def input_func():
+            pass
+
+        def output_func():
+            pass
+
+        self.loader.set_input_formatter(input_func)
+        self.loader.load()
+        combined = self.loader.pre_post_middleware
+
+        self.loader.set_output_formatter(output_func)
+        self.loader.load()
+
+        assert self.loader.pre_post_middleware is not combined
+        assert self.loader.pre_post_middleware is not None
+
     def test_load_with_existing_pre_post_middleware(self):
         """Test load when pre_post_middleware already exists."""
 
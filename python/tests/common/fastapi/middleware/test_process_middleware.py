@@ -0,0 +1,372 @@
+"""Tests for ProcessASGIMiddleware."""
+
+import json
+
+import anyio
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from model_hosting_container_standards.common.fastapi.middleware import (
+    ProcessASGIMiddleware,
+)
+
+
+def _create_app(**kwargs) -> FastAPI:
+    """Create a FastAPI app echoing the request body, wrapped with the middleware."""
+    app = FastAPI()
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return await request.json()
+
+    @app.get("/stream")
+    async def stream():
+        async def generate():
+            for token in (b"a", b"b", b"c"):
+                yield token
+
+        return StreamingResponse(generate(), media_type="text/plain")
+
+    app.add_middleware(ProcessASGIMiddleware, **kwargs)
+    return app
+
+
+class TestProcessASGIMiddleware:
+    """Test ProcessASGIMiddleware request/response handling."""
+
+    def test_passthrough_without_formatters(self):
+        """Test requests pass through unchanged when no formatter is set."""
+        client = TestClient(_create_app())
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.status_code == 200
+        assert response.json() == {"prompt": "hello"}
+
+    async def test_noop_hands_through_original_callables(self):
+        """Test the no-formatter fast path forwards receive/send unwrapped."""
+        seen = {}
+
+        async def app(scope, receive, send):
+            seen["receive"] = receive
+            seen["send"] = send
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            pass
+
+        middleware = ProcessASGIMiddleware(app)
+        await middleware({"type": "http"}, receive, send)
+
+        assert seen["receive"] is receive
+        assert seen["send"] is send
+
+    def test_input_formatter_body_is_replayed(self):
+        """Test a body read by the input formatter still reaches the handler."""
+
+        async def read_body(request):
+            assert await request.json() == {"prompt": "hello"}
+            return request
+
+        client = TestClient(_create_app(input_formatter=read_body))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.status_code == 200
+        assert response.json() == {"prompt": "hello"}
+
+    def test_input_formatter_can_rewrite_body(self):
+        """Test a body rewritten via request._body is seen by the handler."""
+
+        async def rewrite_body(request):
+            body = await request.json()
+            body["model"] = "adapter"
+            request._body = json.dumps(body).encode("utf-8")
+            return request
+
+        client = TestClient(_create_app(input_formatter=rewrite_body))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.json() == {"prompt": "hello", "model": "adapter"}
+
+    def test_output_formatter_receives_full_response(self):
+        """Test the output formatter sees the buffered body and can add headers."""
+        seen_bodies = []
+
+        async def add_header(response):
+            seen_bodies.append(response.body)
+            response.headers["X-Processed"] = "true"
+            return response
+
+        client = TestClient(_create_app(output_formatter=add_header))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.status_code == 200
+        assert response.headers["X-Processed"] == "true"
+        assert response.json() == {"prompt": "hello"}
+        assert json.loads(seen_bodies[0]) == {"prompt": "hello"}
+
+    def test_output_formatter_error_returns_500(self):
+        """Test errors raised by the output formatter produce a 500 response."""
+
+        async def failing_formatter(response):
+            raise ValueError("formatter failed")
+
+        client = TestClient(_create_app(output_formatter=failing_formatter))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.status_code == 500
+        assert response.json()["message"] == "formatter failed"
+
+    def test_sync_formatters_are_not_awaited(self):
+        """Test plain sync formatters are called directly on both sides."""
+
+        def add_model(request):
+            request._body = b'{"prompt": "hello", "model": "adapter"}'
+            return request
+
+        def add_header(response):
+            response.headers["X-Processed"] = "true"
+            return response
+
+        middleware_kwargs = {
+            "input_formatter": add_model,
+            "output_formatter": add_header,
+        }
+        client = TestClient(_create_app(**middleware_kwargs))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.status_code == 200
+        assert response.headers["X-Processed"] == "true"
+        assert response.json() == {"prompt": "hello", "model": "adapter"}
+
+    def test_async_callable_object_formatter_is_awaited(self):
+        """Test callables with an async __call__ are still awaited."""
+
+        class AddHeader:
+            async def __call__(self, response):
+                response.headers["X-Processed"] = "true"
+                return response
+
+        client = TestClient(_create_app(output_formatter=AddHeader()))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.headers["X-Processed"] == "true"
+
+    async def test_streamed_response_is_not_buffered(self):
+        """Test streamed chunks reach the client before the app finishes."""
+        first_chunk_sent = anyio.Event()
+        seen_types = []
+        messages = []
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"a", "more_body": True})
+            # Would block forever if the middleware buffered the whole body
+            with anyio.fail_after(1):
+                await first_chunk_sent.wait()
+            await send({"type": "http.response.body", "body": b"b"})
+
+        async def receive():
+            # No disconnect arrives while the response is streaming
+            await anyio.sleep_forever()
+
+        async def send(message):
+            messages.append(message)
+            if message.get("body") == b"a":
+                first_chunk_sent.set()
+
+        async def record_type(response):
+            seen_types.append(type(response))
+            return response
+
+        middleware = ProcessASGIMiddleware(app, output_formatter=record_type)
+        await middleware({"type": "http", "method": "GET"}, receive, send)
+
+        bodies = [m.get("body") for m in messages if m["type"] == "http.response.body"]
+        assert b"".join(bodies) == b"ab"
+        assert seen_types == [StreamingResponse]
+
+    def test_output_formatter_can_wrap_stream(self):
+        """Test the output formatter can wrap body_iterator of a streamed response."""
+
+        async def upper(response):
+            original = response.body_iterator
+
+            async def transformed():
+                async for chunk in original:
+                    yield chunk.upper()
+
+            response.body_iterator = transformed()
+            response.headers["X-Processed"] = "true"
+            return response
+
+        client = TestClient(_create_app(output_formatter=upper))
+
+        response = client.get("/stream")
+
+        assert response.status_code == 200
+        assert response.headers["X-Processed"] == "true"
+        assert response.text == "ABC"
+
+    def test_output_formatter_can_replace_stream(self):
+        """Test replacing a streamed response does not stall the downstream app."""
+
+        async def replace(response):
+            return JSONResponse({"replaced": True})
+
+        client = TestClient(_create_app(output_formatter=replace))
+
+        response = client.get("/stream")
+
+        assert response.json() == {"replaced": True}
+
+    async def test_output_formatter_can_drain_stream(self):
+        """Test a formatter reading the whole streamed body does not deadlock."""
+
+        async def drain(response):
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            return JSONResponse({"body": body.decode()})
+
+        transport = httpx.ASGITransport(app=_create_app(output_formatter=drain))
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            with anyio.fail_after(3):
+                response = await client.get("/stream")
+
+        assert response.json() == {"body": "abc"}
+
+    def test_output_formatter_can_drain_buffered_body_iterator(self):
+        """Test body_iterator is available on single-message responses."""
+
+        async def drain(response):
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            return JSONResponse({"wrapped": json.loads(body)})
+
+        client = TestClient(_create_app(output_formatter=drain))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.status_code == 200
+        assert response.json() == {"wrapped": {"prompt": "hello"}}
+
+    def test_output_formatter_drained_body_is_still_sent(self):
+        """Test returning the response after draining body_iterator keeps the body."""
+
+        async def inspect_body(response):
+            [chunk async for chunk in response.body_iterator]
+            return response
+
+        client = TestClient(_create_app(output_formatter=inspect_body))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.json() == {"prompt": "hello"}
+
+    def test_output_formatter_can_replace_buffered_body_iterator(self):
+        """Test a replaced body_iterator is streamed without the stale length."""
+
+        async def upper(response):
+            original = response.body_iterator
+
+            async def transformed():
+                async for chunk in original:
+                    yield chunk.upper() + b" "
+
+            response.body_iterator = transformed()
+            return response
+
+        client = TestClient(_create_app(output_formatter=upper))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.text == '{"PROMPT":"HELLO"} '
+        assert "content-length" not in response.headers
+
+    def test_output_formatter_body_rewrite_updates_content_length(self):
+        """Test rewriting response.body keeps content-length in sync."""
+
+        async def rewrite(response):
+            body = json.loads(response.body)
+            body["processed"] = "by the output formatter"
+            response.body = json.dumps(body).encode()
+            return response
+
+        client = TestClient(_create_app(output_formatter=rewrite))
+
+        response = client.post("/echo", json={"prompt": "hello"})
+
+        assert response.json() == {
+            "prompt": "hello",
+            "processed": "by the output formatter",
+        }
+        assert int(response.headers["content-length"]) == len(response.content)
+
+    async def test_extension_messages_are_forwarded(self):
+        """Test responses sent via ASGI extensions reach the client unformatted."""
+        start = {"type": "http.response.start", "status": 200, "headers": []}
+        pathsend = {"type": "http.response.pathsend", "path": "/tmp/file.bin"}
+        formatted = []
+        messages = []
+
+        async def app(scope, receive, send):
+            await send(start)
+            await send(pathsend)
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        async def record(response):
+            formatted.append(response)
+            return response
+
+        middleware = ProcessASGIMiddleware(app, output_formatter=record)
+        await middleware({"type": "http", "method": "GET"}, receive, send)
+
+        assert messages == [start, pathsend]
+        assert formatted == []
+
+    async def test_trailers_are_forwarded(self):
+        """Test responses declaring trailers are forwarded with their trailers."""
+        sent = [
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [],
+                "trailers": True,
+            },
+            {"type": "http.response.body", "body": b"data"},
+            {"type": "http.response.trailers", "headers": [], "more_trailers": False},
+        ]
+        messages = []
+
+        async def app(scope, receive, send):
+            for message in sent:
+                await send(message)
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        async def passthrough(response):
+            return response
+
+        middleware = ProcessASGIMiddleware(app, output_formatter=passthrough)
+        await middleware({"type": "http", "method": "GET"}, receive, send)
+
+        assert messages == sent
@@ -0,0 +1,114 @@
+"""Tests for MiddlewareRegistry."""
+
+import pytest
+
+from model_hosting_container_standards.common.fastapi.middleware.registry import (
+    MiddlewareRegistry,
+)
+from model_hosting_container_standards.common.fastapi.middleware.source.decorator_loader import (
+    decorator_loader,
+)
+
+
+class TestMiddlewareRegistry:
+    """Test MiddlewareRegistry functionality."""
+
+    def setup_method(self):
+        """Setup for each test."""
+        self.registry = MiddlewareRegistry()
+        decorator_loader.clear()
+
+    def teardown_method(self):
+        """Clean up global decorator loader state."""
+        decorator_loader.clear()
+
+    def test_register_invalid_name(self):
+        """Test registering a middleware under a disallowed name."""
+        with pytest.raises(
+            ValueError, match="Allowed names: pre_post_process, throttle"
+        ):
+            self.registry.register_middleware("invalid", lambda: None)
+
+    def test_register_duplicate_reports_types(self):
+        """Test duplicate registration error names both middleware kinds."""
+
+        class ThrottleMiddleware:
+            pass
+
+        self.registry.register_middleware("throttle", ThrottleMiddleware)
+
+        with pytest.raises(ValueError, match="as a class. Cannot register as function"):
+            self.registry.register_middleware("throttle", lambda: None)
+
+    def test_register_class_with_custom_metaclass(self):
+        """Test classes built with a custom metaclass are detected as classes."""
+
+        class Meta(type):
+            pass
+
+        class ThrottleMiddleware(metaclass=Meta):
+            pass
+
+        self.registry.register_middleware("throttle", ThrottleMiddleware)
+
+        assert self.registry.get_middleware("throttle").is_class
+
+    def test_list_middlewares_view_reflects_live_state(self):
+        """Test the names view tracks registrations and clears without copying."""
+        view = self.registry.list_middlewares_view()
+        assert len(view) == 0
+
+        self.registry.register_middleware("throttle", lambda: None)
+        assert "throttle" in view
+
+        self.registry.clear_middlewares()
+        assert len(view) == 0
+
+    def test_allowed_middleware_names_property(self):
+        """Test allowed names are exposed as a frozenset."""
+        names = self.registry.allowed_middleware_names
+
+        assert names == frozenset({"throttle", "pre_post_process"})
+        assert names is self.registry.allowed_middleware_names
+
+    def test_load_middlewares_replaces_rebuilt_formatter_middleware(self):
+        """Test a formatter added after a load reaches the registry on the next load."""
+
+        async def input_func(request):
+            return request
+
+        async def output_func(response):
+            return response
+
+        decorator_loader.set_input_formatter(input_func)
+        self.registry.load_middlewares(None)
+        first = self.registry.get_middleware("pre_post_process").middleware
+
+        decorator_loader.set_output_formatter(output_func)
+        self.registry.load_middlewares(None)
+        second_info = self.registry.get_middleware("pre_post_process")
+        second = second_info.middleware
+
+        assert second is not first
+        assert second_info.is_class
+        instance = second(app=None)
+        assert instance._input_formatter is input_func
+        assert instance._output_formatter is output_func
+
+    def test_load_middlewares_keeps_directly_registered_middleware(self):
+        """Test load does not replace a middleware registered outside of loading."""
+
+        def direct_func():
+            pass
+
+        async def input_func(request):
+            return request
+
+        self.registry.register_middleware("pre_post_process", direct_func)
+        decorator_loader.set_input_formatter(input_func)
+
+        self.registry.load_middlewares(None)
+
+        assert self.registry.get_middleware("pre_post_process").middleware is (
+            direct_func
+        )
@@ -10,6 +10,7 @@ from model_hosting_container_standards.common.fastapi.config import FastAPIEnvVa
 from model_hosting_container_standards.common.handler import handler_registry
 from model_hosting_container_standards.sagemaker.config import SageMakerEnvVars
 from model_hosting_container_standards.sagemaker.handler_resolver import (
+    SageMakerHandlerConfig,
     SageMakerHandlerResolver,
 )
 from model_hosting_container_standards.sagemaker.sagemaker_loader import (
@@ -212,6 +213,48 @@ def custom_sagemaker_invocation_handler(data):
         finally:
             os.unlink(script_path)
 
+    def test_missing_customer_script_is_remembered(self):
+        """Test a missing script is only probed once across handler types."""
+        with tempfile.TemporaryDirectory() as script_dir:
+            with patch.dict(
+                os.environ, {SageMakerEnvVars.SAGEMAKER_MODEL_PATH: script_dir}
+            ):
+                SageMakerFunctionLoader._default_function_loader = None
+                config = SageMakerHandlerConfig()
+
+                with patch.object(
+                    SageMakerFunctionLoader,
+                    "load_function_from_spec",
+                    wraps=SageMakerFunctionLoader.load_function_from_spec,
+                ) as mock_load:
+                    assert config.get_customer_script_handler("ping") is None
+                    assert config.get_customer_script_handler("invoke") is None
+
+                    assert mock_load.call_count == 1
+
+    def test_missing_customer_script_rechecked_after_loader_reset(self):
+        """Test a script written after a miss is found once the loader is reset."""
+        with tempfile.TemporaryDirectory() as script_dir:
+            with patch.dict(
+                os.environ, {SageMakerEnvVars.SAGEMAKER_MODEL_PATH: script_dir}
+            ):
+                SageMakerFunctionLoader._default_function_loader = None
+                config = SageMakerHandlerConfig()
+                assert config.get_customer_script_handler("ping") is None
+
+                with open(os.path.join(script_dir, "model.py"), "w") as f:
+                    f.write(
+                        """
+def custom_sagemaker_ping_handler():
+    return "customer ping"
+"""
+                    )
+                SageMakerFunctionLoader._default_function_loader = None
+
+                handler = config.get_customer_script_handler("ping")
+                assert handler is not None
+                assert handler() == "customer ping"
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -8,6 +8,7 @@ from unittest.mock import patch
 import pytest
 
 from model_hosting_container_standards.common.fastapi.config import FastAPIEnvVars
+from model_hosting_container_standards.exceptions import HandlerFileNotFoundError
 from model_hosting_container_standards.sagemaker.config import SageMakerEnvVars
 from model_hosting_container_standards.sagemaker.sagemaker_loader import (
     SageMakerFunctionLoader,
@@ -20,6 +21,7 @@ class TestSageMakerLoaders:
     @pytest.fixture(autouse=True)
     def setup_method(self):
         """Set up test fixtures."""
+        SageMakerFunctionLoader.reset_function_loaders()
         self.temp_dir = tempfile.mkdtemp()
         self.test_file = Path(self.temp_dir) / "model.py"
 
@@ -53,8 +55,8 @@ class ModelHandler:
 
         shutil.rmtree(self.temp_dir)
 
-        # Clear the class-level cache to avoid test interference
-        SageMakerFunctionLoader._default_function_loader = None
+        # Clear the class-level caches to avoid test interference
+        SageMakerFunctionLoader.reset_function_loaders()
 
     def test_create_loader_with_default_env_vars(self):
         """Test loader creation with default environment variables."""
@@ -97,6 +99,23 @@ class ModelHandler:
             # Test that SAGEMAKER_MODEL_PATH is used as search path
             assert str(self.temp_dir) in loader.file_loader.search_paths
 
+    def test_create_loader_without_customer_script(self):
+        """Test loader creation succeeds when no customer script exists."""
+        with tempfile.TemporaryDirectory() as empty_dir:
+            with patch.dict(os.environ, {"SAGEMAKER_MODEL_PATH": empty_dir}):
+                loader = SageMakerFunctionLoader._create_function_loader(empty_dir)
+
+        assert loader is not None
+
+    def test_create_loader_reports_unresolvable_relative_model_path(self, monkeypatch):
+        """Test a script the loader cannot resolve is reported, not skipped."""
+        monkeypatch.chdir(Path(self.temp_dir).parent)
+        relative_path = Path(self.temp_dir).name
+
+        with patch.dict(os.environ, {"CUSTOM_SCRIPT_FILENAME": "model.py"}):
+            with pytest.raises(HandlerFileNotFoundError):
+                SageMakerFunctionLoader._create_function_loader(relative_path)
+
     def test_preloading_existing_file(self):
         """Test that existing model file is preloaded and cached."""
         # Clear cache first
@@ -572,3 +591,72 @@ def token_counter(text):
             assert func2 is not None
             assert func1("test") == "prediction for test"
             assert func2("test") == "prediction for test"
+
+    def test_load_function_from_spec_custom_path_loads_script_lazily(self):
+        """Test that a custom-path loader does not import the script up front."""
+        custom_temp_dir = tempfile.mkdtemp()
+        try:
+            # A script that fails on import must not be touched for other specs
+            (Path(custom_temp_dir) / "model.py").write_text(
+                "raise RuntimeError('should not be imported')\n"
+            )
+
+            func = SageMakerFunctionLoader.load_function_from_spec(
+                "os.path:exists", custom_script_path=custom_temp_dir
+            )
+
+            assert func is os.path.exists
+        finally:
+            import shutil
+
+            shutil.rmtree(custom_temp_dir)
+
+    def test_custom_path_loader_is_reused(self):
+        """Test that repeated custom-path loads share one function loader."""
+        custom_temp_dir = tempfile.mkdtemp()
+        try:
+            (Path(custom_temp_dir) / "model.py").write_text(
+                "def predict_fn(data):\n    return data\n"
+            )
+
+            with patch.object(
+                SageMakerFunctionLoader,
+                "_create_function_loader",
+                wraps=SageMakerFunctionLoader._create_function_loader,
+            ) as mock_create:
+                func1 = SageMakerFunctionLoader.load_function_from_spec(
+                    "model:predict_fn", custom_script_path=custom_temp_dir
+                )
+                func2 = SageMakerFunctionLoader.load_function_from_spec(
+                    "model:predict_fn", custom_script_path=custom_temp_dir
+                )
+
+            assert func1 is func2
+            assert mock_create.call_count == 1
+        finally:
+            import shutil
+
+            shutil.rmtree(custom_temp_dir)
+
+    def test_reset_function_loaders_reloads_custom_path_script(self):
+        """Test resetting the loaders picks up a rewritten custom-path script."""
+        custom_temp_dir = tempfile.mkdtemp()
+        try:
+            script = Path(custom_temp_dir) / "model.py"
+            script.write_text("def predict_fn(data):\n    return 'old'\n")
+            func = SageMakerFunctionLoader.load_function_from_spec(
+                "model:predict_fn", custom_script_path=custom_temp_dir
+            )
+            assert func("x") == "old"
+
+            script.write_text("def predict_fn(data):\n    return 'new'\n")
+            SageMakerFunctionLoader.reset_function_loaders()
+
+            func = SageMakerFunctionLoader.load_function_from_spec(
+                "model:predict_fn", custom_script_path=custom_temp_dir
+            )
+            assert func("x") == "new"
+        finally:
+            import shutil
+
+            shutil.rmtree(custom_temp_dir)
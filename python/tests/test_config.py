@@ -0,0 +1,62 @@
+"""Unit tests for environment variable configuration mappings."""
+
+import dataclasses
+
+import pytest
+
+from model_hosting_container_standards.common.fastapi.config import (
+    FASTAPI_ENV_CONFIG,
+    FastAPIEnvVars,
+)
+from model_hosting_container_standards.config import EnvSpec
+from model_hosting_container_standards.sagemaker.config import (
+    SAGEMAKER_ENV_CONFIG,
+    SageMakerDefaults,
+    SageMakerEnvVars,
+)
+
+
+class TestEnvConfig:
+    """Test FASTAPI_ENV_CONFIG and SAGEMAKER_ENV_CONFIG."""
+
+    @pytest.mark.parametrize("config", [FASTAPI_ENV_CONFIG, SAGEMAKER_ENV_CONFIG])
+    def test_entries_are_env_specs(self, config):
+        """Test every entry exposes default and description attributes."""
+        for spec in config.values():
+            assert isinstance(spec, EnvSpec)
+            assert isinstance(spec.description, str)
+
+    def test_entry_attribute_access(self):
+        """Test entries are read via attributes rather than dict keys."""
+        ping = FASTAPI_ENV_CONFIG[FastAPIEnvVars.CUSTOM_FASTAPI_PING_HANDLER]
+        script = SAGEMAKER_ENV_CONFIG[SageMakerEnvVars.CUSTOM_SCRIPT_FILENAME]
+
+        assert ping.default is None
+        assert "ping handler" in ping.description
+        assert script.default == SageMakerDefaults.SCRIPT_FILENAME
+
+    @pytest.mark.parametrize("config", [FASTAPI_ENV_CONFIG, SAGEMAKER_ENV_CONFIG])
+    def test_mapping_is_read_only(self, config):
+        """Test the mappings cannot be modified."""
+        name = next(iter(config))
+
+        with pytest.raises(TypeError):
+            config[name] = EnvSpec(default=None, description="")
+        with pytest.raises(TypeError):
+            del config[name]
+
+    def test_entries_are_frozen(self):
+        """Test individual entries cannot be modified."""
+        spec = FASTAPI_ENV_CONFIG[FastAPIEnvVars.CUSTOM_PRE_PROCESS]
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            spec.default = "model.py:pre"
+
+    def test_env_spec_exported_with_mappings(self):
+        """Test EnvSpec is importable next to the public config mappings."""
+        from model_hosting_container_standards import common, sagemaker
+
+        assert common.fastapi.EnvSpec is EnvSpec
+        assert common.fastapi.FASTAPI_ENV_CONFIG is FASTAPI_ENV_CONFIG
+        assert sagemaker.EnvSpec is EnvSpec
+        assert sagemaker.SAGEMAKER_ENV_CONFIG is SAGEMAKER_ENV_CONFIG